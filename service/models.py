@@ -61,6 +61,10 @@ class Category(Enum):
     TOOLS = 5
 
 
+# Lookup of Category members by name, built once for deserialize()
+_CATEGORY_MAP = {category.name: category for category in Category}
+
+
 class Product(db.Model):
     """
     Class that represents a Product
@@ -141,9 +145,10 @@ class Product(db.Model):
                     "Invalid type for boolean [available]: "
                     + str(type(data["available"]))
                 )
-            self.category = getattr(Category, data["category"])  # create enum from string
-        except AttributeError as error:
-            raise DataValidationError("Invalid attribute: " + error.args[0]) from error
+            if data["category"] in _CATEGORY_MAP:
+                self.category = _CATEGORY_MAP[data["category"]]  # create enum from string
+            else:
+                raise DataValidationError("Invalid attribute: " + str(data["category"]))
         except KeyError as error:
             raise DataValidationError("Invalid product: missing " + error.args[0]) from error
         except TypeError as error:
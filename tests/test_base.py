@@ -0,0 +1,33 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Base Test Case for tests that use the database
+
+Each test class runs inside a single outer transaction (see the
+db_connection fixture in conftest.py) and every test runs inside a
+SAVEPOINT that is rolled back when the test ends, so no rows are ever
+left behind for the next test to clean up. Tests marked with no_db skip
+the SAVEPOINT.
+"""
+from unittest import TestCase
+import pytest
+
+
+######################################################################
+#  B A S E   T E S T   C A S E
+######################################################################
+@pytest.mark.usefixtures("app_fixture", "db_connection")
+class BaseTestCase(TestCase):
+    """Base Test Case that rolls back all changes after each test"""
@@ -1,4 +1,11 @@
+"""
+Test cases for the Error Handlers
+
+These tests only need the Flask app, so they do not use BaseTestCase and
+never open its outer database transaction.
+"""
 import unittest
+import pytest
 from service import app
 from service.common import status
 
@@ -6,14 +13,22 @@ from service.common import status
 class TestErrorHandlers(unittest.TestCase):
     """Test error handlers"""
 
+    @classmethod
+    def setUpClass(cls):
+        """This runs once before all of the tests"""
+        app.config["TESTING"] = True
+
     def setUp(self):
+        """This runs before each test"""
         self.client = app.test_client()
 
+    @pytest.mark.no_db
     def test_unsupported_media_type(self):
         """It should return 415 Unsupported Media Type"""
         response = self.client.post("/products", data="{}", content_type="text/plain")
         self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
 
+    @pytest.mark.no_db
     def test_method_not_allowed(self):
         """It should return 405 Method Not Allowed"""
         response = self.client.put("/products")
@@ -24,6 +39,7 @@ class TestErrorHandlers(unittest.TestCase):
         response = self.client.get("/products/999999")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    @pytest.mark.no_db
     def test_internal_server_error(self):
         """It should return 500 Internal Server Error"""
         response = self.client.get("/cause-error")